@@ -11,6 +11,7 @@ from PIL import Image
 from pathlib import Path
 from fpdf import FPDF
 import os
+from draw_catalogue import DrawCatalogue, load_confederations
 
 
 # ---------------------------
@@ -309,6 +310,16 @@ def run_draw_engine(pots, groups_template, conf_rules, attempts=50, seed=None):
     engine = DrawEngine(pots, groups_template, conf_rules, seed=seed)
     return engine.run_draw(max_attempts=attempts)
 
+# ---------------------------
+# Draw catalogue (draw IDs)
+# ---------------------------
+@st.cache_resource
+def get_catalogue():
+    # counting every valid draw takes a few seconds, so build it once per server
+    pots_data = load_json(POTS_FILE)
+    pots_data = pots_data.get('pots', pots_data)
+    return DrawCatalogue(pots_data, load_json(GROUPS_FILE), load_json(CONF_RULES_FILE), load_confederations(load_json(CONFIRMED_FILE)))
+
 # ---------------------------
 # Streamlit UI
 # ---------------------------
@@ -419,6 +430,8 @@ with left:
     seed = st.number_input('Seed', min_value=0, max_value=10_000_000, value=42)
     attempts = st.number_input('Max attempts', min_value=1, max_value=20000, value=200)
     run_btn = st.button('Run Draw Now 🏆')
+    draw_id_text = st.text_input('Draw ID', value='')
+    load_id_btn = st.button('Load Draw ID 🔢')
 with right:
     if 'pdf_trigger' not in st.session_state:
         st.session_state['pdf_trigger'] = False
@@ -448,11 +461,30 @@ if run_btn:
         """
         st.markdown(anim, unsafe_allow_html=True)
 
+# Load draw by ID
+if load_id_btn:
+    st.session_state['pdf_trigger'] = False
+    try:
+        groups_result = get_catalogue().decode(int(draw_id_text.strip()))
+    except ValueError as e:
+        st.error(f'Invalid draw ID: {e}')
+        groups_result = None
+
+    if groups_result:
+        st.success('Draw loaded from ID — saving results')
+        save_json(OUT_FILE, {'groups': groups_result})
+        st.session_state['groups_result'] = groups_result
+
 # Show final groups
 if 'groups_result' in st.session_state:
     st.subheader('📊 Final Groups')
     groups_result = st.session_state['groups_result']
     group_letters = sorted(groups_result.keys())
+    catalogue = get_catalogue()
+    try:
+        st.caption(f"Draw ID: {catalogue.encode(groups_result)} of {catalogue.total:,} valid draws")
+    except ValueError as e:
+        st.caption(f"No draw ID: {e}")
     
     # HTML structure for the grid and the print target ID
     results_html = "<div id='draw-results-container'>"
@@ -0,0 +1,346 @@
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+
+# -----------------------------------------------------------
+#  Paths & Files
+# -----------------------------------------------------------
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+POTS_FILE = DATA_DIR / "pots.json"
+GROUPS_FILE = DATA_DIR / "groups.json"
+CONF_RULES_FILE = DATA_DIR / "confederation_rules.json"
+CONFIRMED_FILE = DATA_DIR / "confirmed_teams.json"
+OUT_FILE = DATA_DIR / "groups_out.json"
+
+# Confederations that never count towards a per-group limit
+UNRESTRICTED = ("MIXED", "UNKNOWN")
+
+
+# -----------------------------------------------------------
+#  DRAW CATALOGUE (rank / unrank of every valid draw)
+# -----------------------------------------------------------
+
+class DrawCatalogue:
+    """Numbers every valid draw with a unique integer ID.
+
+    Teams are placed in a fixed order (pot by pot, then by confederation,
+    then pots.json order; hosts skipped) and each team tries the groups
+    A, B, C, ... in turn.
+    The ID of a draw is its position in that ordering, found by summing
+    the number of valid completions of every earlier choice. Completion
+    counts only depend on the confederation make-up of each group, so
+    they are memoised on a canonical (sorted) group state.
+    """
+
+    def __init__(self, pots: dict, groups_template: dict, conf_rules: dict, confederations: dict):
+        # expected pots: {'pot1':[...], 'pot2':[...]}
+        # groups_template: {'groups': {'A': {'1': None,...}, ...}}
+        # confederations: {'ESP': 'UEFA', ...}
+        conf_rules = conf_rules or {}
+        template = groups_template.get("groups", {})
+        self.groups = sorted(template.keys())
+        self.pot_names = sorted(pots.keys())
+
+        # hosts already sitting in the template are not part of the draw
+        self.fixed = {}
+        for g in self.groups:
+            for pos, team in template[g].items():
+                if team is not None:
+                    self.fixed[team] = (g, pos)
+
+        # (team, slot) pairs in placement order
+        self.order = []
+        for i, potname in enumerate(self.pot_names, start=1):
+            for team in pots[potname]:
+                if team not in self.fixed:
+                    self.order.append((team, str(i)))
+
+        self.team_confed = {t: confederations.get(t, "UNKNOWN") for t, _ in self.order}
+        for t in self.fixed:
+            self.team_confed[t] = confederations.get(t, "UNKNOWN")
+
+        # within a pot, keep each confederation together so it drops out of the memo key early
+        self.order.sort(key=lambda item: (item[1], self.team_confed[item[0]]))
+
+        limits = conf_rules.get("confederations", {})
+        self.confeds = sorted(c for c in set(self.team_confed.values()) if c not in UNRESTRICTED)
+        self.limits = tuple(limits.get(c, {}).get("max_per_group", 1) for c in self.confeds)
+        uefa_min = conf_rules.get("draw_rules", {}).get("uefa_limit", {}).get("min")
+        self.uefa_index = self.confeds.index("UEFA") if "UEFA" in self.confeds else None
+        self.uefa_min = uefa_min if self.uefa_index is not None else None
+
+        # pathway pairs must end up in opposite halves (A-F vs G-L)
+        pathway = conf_rules.get("draw_rules", {}).get("pathway_separation", {})
+        self.pathway_bit = {}
+        for i, key in enumerate(sorted(k for k in pathway if k.startswith("pair"))):
+            for team in pathway[key]:
+                self.pathway_bit[team] = 1 << i
+
+        # what is still relevant from each step on (for the memo key)
+        self.live_confeds = []
+        self.live_pathway = []
+        for step in range(len(self.order) + 1):
+            rest = self.order[step:]
+            self.live_confeds.append(tuple(c in {self.team_confed[t] for t, _ in rest} for c in self.confeds))
+            self.live_pathway.append(any(t in self.pathway_bit for t, _ in rest))
+
+        self.initial_state = self._build_initial_state(template)
+        self._memo = {}
+        self.total = self.count_completions(0, self.initial_state)
+
+    # -----------------------------------------
+
+    def _half(self, group):
+        return 0 if self.groups.index(group) < len(self.groups) // 2 else 1
+
+    def _build_initial_state(self, template):
+        """Per-group state: (teams placed, confed counts, half, pathway bits)."""
+        state = []
+        for g in self.groups:
+            counts = [0] * len(self.confeds)
+            size = 0
+            bits = 0
+            for team in template[g].values():
+                if team is None:
+                    continue
+                size += 1
+                confed = self.team_confed[team]
+                if confed in self.confeds:
+                    counts[self.confeds.index(confed)] += 1
+                bits |= self.pathway_bit.get(team, 0)
+            state.append((size, tuple(counts), self._half(g), bits))
+        return tuple(state)
+
+    def _place(self, state, index, team, slot):
+        """Return the new state after putting team into group index, or None if invalid."""
+        size, counts, half, bits = state[index]
+        if size != int(slot) - 1:
+            return None
+
+        confed = self.team_confed[team]
+        if confed in self.confeds:
+            c = self.confeds.index(confed)
+            if counts[c] + 1 > self.limits[c]:
+                return None
+            counts = counts[:c] + (counts[c] + 1,) + counts[c + 1:]
+
+        bit = self.pathway_bit.get(team, 0)
+        if bit:
+            for other in state:
+                if other[3] & bit and other[2] == half:
+                    return None
+
+        new_state = list(state)
+        new_state[index] = (size + 1, counts, half, bits | bit)
+        return tuple(new_state)
+
+    def _canonical(self, step, state, projected=False):
+        """Memo key: group states with anything no later team can see zeroed out, sorted.
+
+        If state was already projected for step - 1 and nothing dropped out
+        since, sorting is enough.
+        """
+        live = self.live_confeds[step]
+        pathway = self.live_pathway[step]
+        if projected and live == self.live_confeds[step - 1] and pathway == self.live_pathway[step - 1]:
+            return tuple(sorted(state))
+        key = []
+        for size, counts, half, bits in state:
+            counts = tuple(n if alive else 0 for n, alive in zip(counts, live))
+            key.append((size, counts, half if pathway else 0, bits if pathway else 0))
+        return tuple(sorted(key))
+
+    def _is_complete(self, state):
+        if self.uefa_min is None:
+            return True
+        return all(s[1][self.uefa_index] >= self.uefa_min for s in state)
+
+    def count_completions(self, step, state, projected=False):
+        """Number of valid ways to place teams order[step:] given state."""
+        # the UEFA minimum is settled as soon as the last UEFA team is placed
+        if self.uefa_min is not None and not self.live_confeds[step][self.uefa_index]:
+            if step == 0 or self.live_confeds[step - 1][self.uefa_index]:
+                if not self._is_complete(state):
+                    return 0
+
+        if step == len(self.order):
+            return 1
+
+        state = self._canonical(step, state, projected)
+        key = (step, state)
+        if key in self._memo:
+            return self._memo[key]
+
+        # groups in an identical state give identical completions
+        team, slot = self.order[step]
+        total = 0
+        for i, group_state in enumerate(state):
+            if i > 0 and state[i - 1] == group_state:
+                continue
+            new_state = self._place(state, i, team, slot)
+            if new_state is not None:
+                same = state.count(group_state)
+                total += same * self.count_completions(step + 1, new_state, projected=True)
+
+        self._memo[key] = total
+        return total
+
+    # -----------------------------------------
+
+    def decode(self, draw_id: int) -> dict:
+        """Turn a draw ID into a groups result ({'A': {'1': 'MEX', ...}, ...})."""
+        if not 0 <= draw_id < self.total:
+            raise ValueError(f"Draw ID must be in [0, {self.total}), got {draw_id}")
+
+        result = {g: {str(i): None for i in range(1, len(self.pot_names) + 1)} for g in self.groups}
+        for team, (g, pos) in self.fixed.items():
+            result[g][pos] = team
+
+        state = self.initial_state
+        remaining = draw_id
+        for step, (team, slot) in enumerate(self.order):
+            for i, g in enumerate(self.groups):
+                new_state = self._place(state, i, team, slot)
+                if new_state is None:
+                    continue
+                n = self.count_completions(step + 1, new_state)
+                if remaining < n:
+                    result[g][slot] = team
+                    state = new_state
+                    break
+                remaining -= n
+        return result
+
+    def encode(self, groups_result: dict) -> int:
+        """Turn a groups result back into its draw ID. Raises ValueError if the draw is not valid."""
+        location = {}
+        for g, slots in groups_result.items():
+            for pos, team in slots.items():
+                if team in location:
+                    raise ValueError(f"{team} appears more than once in the draw")
+                location[team] = (g, str(pos))
+
+        for team, where in self.fixed.items():
+            if location.get(team) != where:
+                raise ValueError(f"{team} must be in Group {where[0]} position {where[1]}")
+        if len(location) != len(self.fixed) + len(self.order):
+            raise ValueError("Draw does not contain exactly the teams from the pots")
+
+        state = self.initial_state
+        draw_id = 0
+        for step, (team, slot) in enumerate(self.order):
+            if team not in location or location[team][1] != slot or location[team][0] not in self.groups:
+                raise ValueError(f"{team} is missing or not in a pot {slot} position")
+            target = self.groups.index(location[team][0])
+            for i in range(target):
+                new_state = self._place(state, i, team, slot)
+                if new_state is not None:
+                    draw_id += self.count_completions(step + 1, new_state)
+            state = self._place(state, target, team, slot)
+            if state is None:
+                raise ValueError(f"{team} breaks the draw rules in Group {location[team][0]}")
+
+        if not self._is_complete(state):
+            raise ValueError("Draw breaks the UEFA minimum per group")
+        return draw_id
+
+    def random_id(self, rng=None) -> int:
+        """Uniformly random draw ID."""
+        return (rng or random).randrange(self.total)
+
+    def decode_range(self, start: int, stop: int):
+        """Yield (draw_id, groups_result) for every ID in [start, stop)."""
+        for draw_id in range(max(start, 0), min(stop, self.total)):
+            yield draw_id, self.decode(draw_id)
+
+
+# -----------------------------------------------------------
+#  HELPER UTILITIES
+# -----------------------------------------------------------
+
+def load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_confederations(confirmed: dict) -> dict:
+    """Map team/slot IDs to confederations from confirmed_teams.json data."""
+    mapping = {}
+    for item in confirmed.get("teams", []) + confirmed.get("slots", []):
+        key = item.get("id") or item.get("slot_id")
+        if key:
+            mapping[key] = item.get("confederation") or "UNKNOWN"
+    return mapping
+
+
+def load_catalogue(data_dir=DATA_DIR):
+    """Build a DrawCatalogue from the JSON files in data/."""
+    data_dir = Path(data_dir)
+    pots = load_json(data_dir / POTS_FILE.name)
+    pots = pots.get("pots", pots)
+    return DrawCatalogue(
+        pots,
+        load_json(data_dir / GROUPS_FILE.name),
+        load_json(data_dir / CONF_RULES_FILE.name),
+        load_confederations(load_json(data_dir / CONFIRMED_FILE.name)),
+    )
+
+
+# -----------------------------------------------------------
+#  CLI
+# -----------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encode / decode FIFA 2026 draws as integer IDs.")
+    parser.add_argument("--data-dir", default=str(DATA_DIR), help="directory with pots/groups/rules JSON")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("count", help="print the number of valid draws")
+
+    p_decode = sub.add_parser("decode", help="print the groups for a draw ID")
+    p_decode.add_argument("draw_id", type=int)
+
+    p_encode = sub.add_parser("encode", help="print the draw ID of a groups JSON file")
+    p_encode.add_argument("path", nargs="?", default=str(OUT_FILE))
+
+    p_range = sub.add_parser("range", help="print one JSON line per draw for IDs in [start, stop)")
+    p_range.add_argument("start", type=int)
+    p_range.add_argument("stop", type=int)
+
+    p_random = sub.add_parser("random", help="print a uniformly random draw ID and its groups")
+    p_random.add_argument("--seed", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    catalogue = load_catalogue(args.data_dir)
+
+    if args.command == "count":
+        print(catalogue.total)
+    elif args.command == "decode":
+        try:
+            groups = catalogue.decode(args.draw_id)
+        except ValueError as e:
+            parser.exit(1, f"error: {e}\n")
+        print(json.dumps({"draw_id": args.draw_id, "groups": groups}, indent=2))
+    elif args.command == "encode":
+        data = load_json(args.path)
+        try:
+            draw_id = catalogue.encode(data.get("groups", data))
+        except ValueError as e:
+            parser.exit(1, f"error: {e}\n")
+        print(draw_id)
+    elif args.command == "range":
+        for draw_id, groups in catalogue.decode_range(args.start, args.stop):
+            print(json.dumps({"draw_id": draw_id, "groups": groups}))
+    elif args.command == "random":
+        draw_id = catalogue.random_id(random.Random(args.seed))
+        print(json.dumps({"draw_id": draw_id, "groups": catalogue.decode(draw_id)}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())